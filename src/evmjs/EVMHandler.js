@@ -47,6 +47,10 @@ EVMHandler = {
   txCnt: 0,
   contractCount: 0,
   maxContractCount: 300,
+  // saved state roots, keyed by snapshot id
+  snapshots: {},
+  // ids are never reused so that snapshots taken before a re-init cannot be confused with new ones
+  snapshotCount: 0,
 
   autoInit: () => {
     return new Promise((resolve, reject) => {
@@ -64,6 +68,7 @@ EVMHandler = {
     return new Promise((resolve, reject) => {
       EVMHandler.accounts = {}
       EVMHandler.contracts = {}
+      EVMHandler.snapshots = {}
       EVMHandler.initVM().then((vm) => {
         EVMHandler.vm = vm;
         EVMHandler.web3vm = new remixLib.vm.Web3VMProvider()
@@ -193,6 +198,35 @@ EVMHandler = {
     })
   },
 
+  // save the current state root; cached accounts are flushed into the trie first
+  snapshot: () => {
+    return new Promise((resolve, reject) => {
+      EVMHandler.vm.stateManager._cache.flush((err) => {
+        if (err) {
+          reject(err);
+          return;
+        }
+        let id = EVMHandler.snapshotCount++;
+        EVMHandler.snapshots[id] = EVMHandler.stateTrie.root;
+        resolve(id);
+      })
+    })
+  },
+
+  // restore a state root saved by snapshot(); resolve false if it is unknown
+  revertToSnapshot: (id) => {
+    return new Promise((resolve, reject) => {
+      if (!(id in EVMHandler.snapshots)) {
+        resolve(false);
+        return;
+      }
+      EVMHandler.vm.stateManager._cache.clear();
+      EVMHandler.vm.stateManager._storageTries = {};
+      EVMHandler.stateTrie.root = EVMHandler.snapshots[id];
+      resolve(true);
+    })
+  },
+
   debug: (txhash) => {
     return new Promise((resolve, reject) => {
       EVMHandler.debugger.debug(txhash);
@@ -31,7 +31,7 @@ async function getAccountsWrapper(call) {
   try {
     let accs = await evmHandler.getAccounts();
     call.write({
-      data: JSON.stringify(accs)
+      balances: accs
     });
     call.end();
   } catch (err) {
@@ -60,10 +60,8 @@ function compileWrapper(sourceObj) {
 }
 
 async function deployWrapper(call) {
-  let contract = null;
   try {
-    contract = JSON.parse(call.request.data);
-    let res = await evmHandler.deploy(contract)
+    let res = await evmHandler.deploy(call.request)
     call.write({
       address: res.address
     });
@@ -74,12 +72,15 @@ async function deployWrapper(call) {
   }
 }
 
+async function executeTx(request) {
+  let revertCallFlag = request.opts != 0;
+  let res = await evmHandler.sendTx(request.fromAddr, request.toAddr, request.value, request.data, revertCallFlag);
+  return await evmHandler.debug(res.tx);
+}
+
 async function sendTxWrapper(call) {
   try {
-    if (call.request.opts == 0) revertCallFlag = false
-    else revertCallFlag = true
-    let res = await evmHandler.sendTx(call.request.fromAddr, call.request.toAddr, call.request.value, call.request.data, revertCallFlag);
-    let trace = await evmHandler.debug(res.tx);
+    let trace = await executeTx(call.request);
     call.write({
       data: JSON.stringify(trace)
     });
@@ -90,6 +91,71 @@ async function sendTxWrapper(call) {
   }
 }
 
+function sendTxBatchWrapper(call) {
+  // transactions are executed strictly in the order they are received
+  let pending = Promise.resolve();
+  call.on('data', (request) => {
+    pending = pending.then(async () => {
+      try {
+        let trace = await executeTx(request);
+        call.write({
+          data: JSON.stringify(trace)
+        });
+      } catch (err) {
+        console.log(err);
+        // keep responses aligned with requests
+        call.write({ data: "" });
+      }
+    });
+  });
+  call.on('end', () => {
+    pending.then(() => { call.end(); });
+  });
+}
+
+function sendTxSequenceWithRevertProbeWrapper(call) {
+  let requests = [];
+  call.on('data', (request) => {
+    requests.push(request);
+  });
+  call.on('end', async () => {
+    let bundle = { normal: [], reverted: [] };
+    for (let [revert, traces] of [[0, bundle.normal], [1, bundle.reverted]]) {
+      for (let request of requests) {
+        try {
+          let trace = await executeTx(Object.assign({}, request, { opts: revert }));
+          traces.push(JSON.stringify(trace));
+        } catch (err) {
+          console.log(err);
+          traces.push("");
+        }
+      }
+    }
+    call.write(bundle);
+    call.end();
+  });
+}
+
+async function snapshotWrapper(call, callback) {
+  try {
+    let id = await evmHandler.snapshot();
+    callback(null, { id: id });
+  } catch (err) {
+    console.log(err);
+    callback(err);
+  }
+}
+
+async function revertToSnapshotWrapper(call, callback) {
+  try {
+    let success = await evmHandler.revertToSnapshot(call.request.id);
+    callback(null, { option: success ? 1 : 0 });
+  } catch (err) {
+    console.log(err);
+    callback(null, { option: 0 });
+  }
+}
+
 function getServer() {
   var server = new grpc.Server();
   server.addService(evm.EVM.service, {
@@ -97,14 +163,20 @@ function getServer() {
     getAccounts: getAccountsWrapper,
     compile: (call, callback) => { callback(null, compileWrapper(call.request)); },
     deploy: deployWrapper,
-    sendTx: sendTxWrapper
+    sendTx: sendTxWrapper,
+    sendTxBatch: sendTxBatchWrapper,
+    sendTxSequenceWithRevertProbe: sendTxSequenceWithRevertProbeWrapper,
+    snapshot: snapshotWrapper,
+    revertToSnapshot: revertToSnapshotWrapper
   });
   return server;
 }
 
+// run several servers on distinct ports (e.g. EVM_PORT=50052 node index.js) to build an evm pool
+const port = process.env.EVM_PORT || 50051;
 var evmServer = getServer();
-evmServer.bind('0.0.0.0:50051', grpc.ServerCredentials.createInsecure());
+evmServer.bind('0.0.0.0:' + port, grpc.ServerCredentials.createInsecure());
 evmServer.start();
-console.log("server listening ...")
+console.log("server listening on port " + port + " ...")
 
 exports.server = getServer();
\ No newline at end of file
@@ -26,6 +26,7 @@ FUZZ_CONFIG = {
     "random_action_prob": 0.4,
     "account_balance": "0xffffffffffffffffffffffffffffffff",
     "max_attempt": 100,
+    "mutation_candidate_num": 32,
     "valid_mutation_reward": 1,
     "vulnerability_reward": 1,
     "exploit_reward": 2,
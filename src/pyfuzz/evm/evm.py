@@ -12,6 +12,7 @@ logger = logging.getLogger("EVM")
 
 class EvmHandler():
     def __init__(self, endpoint='localhost:50051'):
+        self.endpoint = endpoint
         self.channel = grpc.insecure_channel(endpoint)
         self.stub = pyfuzz.evm.evm_pb2_grpc.EVMStub(self.channel)
 
@@ -20,14 +21,22 @@ class EvmHandler():
         ret = self.stub.Reset(status)
         return
 
-    def getAccounts(self, option=0):
+    def requestAccounts(self, option=0):
+        """
+        start a GetAccounts call without waiting for its response; pass the returned call to getAccounts
+        """
         status = pyfuzz.evm.evm_pb2.Status(option=option)
+        return self.stub.GetAccounts(status)
+
+    def getAccounts(self, option=0, call=None):
+        if call is None:
+            call = self.requestAccounts(option)
         ret = None
-        for i in self.stub.GetAccounts(status):
-            ret = i.data
+        for i in call:
+            ret = dict(i.balances)
             break
         if ret and len(ret) > 0:
-            return json.loads(ret)
+            return ret
         else:
             logger.error("Correct response not received from rpc server (getAccounts)")
             return None
@@ -42,22 +51,48 @@ class EvmHandler():
             return None
 
     def deploy(self, contract):
-        new_contract = {}
-        if "bytecode" in contract:
-            new_contract["bytecode"] = contract["bytecode"]
-        else:
+        if "bytecode" not in contract:
             return None
-        contractRpc = pyfuzz.evm.evm_pb2.Json(data=json.dumps(new_contract))
+        contractRpc = pyfuzz.evm.evm_pb2.Contract(bytecode=contract["bytecode"])
         ret = None
         for i in self.stub.Deploy(contractRpc):
             ret = i.address
             break
         return ret
 
-    def sendTx(self, fromAddr, toAddr, value, data, opts={}):
+    @staticmethod
+    def _encodeTxOpts(opts):
         sentOpts = 0
         if "revert" in opts and opts["revert"]:
             sentOpts += 1
+        return sentOpts
+
+    def snapshot(self):
+        """
+        save the current world state of evm and return the snapshot id
+        """
+        status = pyfuzz.evm.evm_pb2.Status(option=0)
+        try:
+            ret = self.stub.Snapshot(status)
+        except grpc.RpcError as e:
+            logger.error("Correct response not received from rpc server (snapshot): {}".format(str(e)))
+            return None
+        return ret.id
+
+    def revertToSnapshot(self, snapshotId):
+        """
+        restore the world state saved by snapshot(); return False if the snapshot is no longer available
+        """
+        snapshotIdRpc = pyfuzz.evm.evm_pb2.SnapshotId(id=snapshotId)
+        try:
+            ret = self.stub.RevertToSnapshot(snapshotIdRpc)
+        except grpc.RpcError as e:
+            logger.error("Correct response not received from rpc server (revertToSnapshot): {}".format(str(e)))
+            return False
+        return ret.option == 1
+
+    def sendTx(self, fromAddr, toAddr, value, data, opts={}):
+        sentOpts = self._encodeTxOpts(opts)
         sendTxData = pyfuzz.evm.evm_pb2.SendTxData(fromAddr=fromAddr, toAddr=toAddr, value=value, data=data, opts=sentOpts)
         ret = None
         for i in self.stub.SendTx(sendTxData):
@@ -68,3 +103,41 @@ class EvmHandler():
         else:
             logger.error("Correct response not received from rpc server (sendTx)")
             return None
+
+    def sendTxBatch(self, txs, opts={}):
+        """
+        send a list of (fromAddr, toAddr, value, data) in one streaming call.
+        Return a list of traces aligned with txs (None for failed transactions)
+        """
+        sentOpts = self._encodeTxOpts(opts)
+        requests = (pyfuzz.evm.evm_pb2.SendTxData(fromAddr=fromAddr, toAddr=toAddr, value=value, data=data, opts=sentOpts)
+                    for fromAddr, toAddr, value, data in txs)
+        ret = []
+        for i in self.stub.SendTxBatch(requests):
+            if len(i.data) > 0:
+                ret.append(json.loads(i.data))
+            else:
+                ret.append(None)
+        if len(ret) < len(txs):
+            logger.error("Correct response not received from rpc server (sendTxBatch)")
+            ret += [None for _ in range(len(txs) - len(ret))]
+        return ret
+
+    def sendTxBatchWithRevertProbe(self, txs):
+        """
+        send a list of (fromAddr, toAddr, value, data) in one streaming call; the server executes them
+        and then executes them again with external calls reverted.
+        Return two lists of traces (normal, reverted) aligned with txs
+        """
+        requests = (pyfuzz.evm.evm_pb2.SendTxData(fromAddr=fromAddr, toAddr=toAddr, value=value, data=data)
+                    for fromAddr, toAddr, value, data in txs)
+        bundle = None
+        for i in self.stub.SendTxSequenceWithRevertProbe(requests):
+            bundle = i
+            break
+        if bundle is None or len(bundle.normal) != len(txs) or len(bundle.reverted) != len(txs):
+            logger.error("Correct response not received from rpc server (sendTxBatchWithRevertProbe)")
+            return [None for _ in txs], [None for _ in txs]
+        normal = [json.loads(data) if len(data) > 0 else None for data in bundle.normal]
+        reverted = [json.loads(data) if len(data) > 0 else None for data in bundle.reverted]
+        return normal, reverted
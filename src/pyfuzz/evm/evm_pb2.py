@@ -19,7 +19,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='evm',
   syntax='proto3',
   serialized_options=None,
-  serialized_pb=_b('\n\tevm.proto\x12\x03\x65vm\"\x18\n\x06Status\x12\x0e\n\x06option\x18\x01 \x01(\r\"$\n\x06Source\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"\x14\n\x04Json\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\"\x1a\n\x07\x41\x64\x64ress\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"Y\n\nSendTxData\x12\x10\n\x08\x66romAddr\x18\x01 \x01(\t\x12\x0e\n\x06toAddr\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\t\x12\x0c\n\x04opts\x18\x05 \x01(\r2\xcd\x01\n\x03\x45VM\x12%\n\x05Reset\x12\x0b.evm.Status\x1a\x0b.evm.Status\"\x00\x30\x01\x12)\n\x0bGetAccounts\x12\x0b.evm.Status\x1a\t.evm.Json\"\x00\x30\x01\x12#\n\x07\x43ompile\x12\x0b.evm.Source\x1a\t.evm.Json\"\x00\x12%\n\x06\x44\x65ploy\x12\t.evm.Json\x1a\x0c.evm.Address\"\x00\x30\x01\x12(\n\x06SendTx\x12\x0f.evm.SendTxData\x1a\t.evm.Json\"\x00\x30\x01\x62\x06proto3')
+  serialized_pb=_b('\n\tevm.proto\x12\x03\x65vm\"\x18\n\x06Status\x12\x0e\n\x06option\x18\x01 \x01(\r\"$\n\x06Source\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"\x14\n\x04Json\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\"\x1c\n\x08\x43ontract\x12\x10\n\x08\x62ytecode\x18\x01 \x01(\t\"j\n\x08\x41\x63\x63ounts\x12-\n\x08\x62\x61lances\x18\x01 \x03(\x0b\x32\x1b.evm.Accounts.BalancesEntry\x1a/\n\rBalancesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x1a\n\x07\x41\x64\x64ress\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"Y\n\nSendTxData\x12\x10\n\x08\x66romAddr\x18\x01 \x01(\t\x12\x0e\n\x06toAddr\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\t\x12\x0c\n\x04opts\x18\x05 \x01(\r\"\x18\n\nSnapshotId\x12\n\n\x02id\x18\x01 \x01(\r\"/\n\x0bTraceBundle\x12\x0e\n\x06normal\x18\x01 \x03(\t\x12\x10\n\x08reverted\x18\x02 \x03(\t2\xb0\x03\n\x03\x45VM\x12%\n\x05Reset\x12\x0b.evm.Status\x1a\x0b.evm.Status\"\x00\x30\x01\x12-\n\x0bGetAccounts\x12\x0b.evm.Status\x1a\r.evm.Accounts\"\x00\x30\x01\x12#\n\x07\x43ompile\x12\x0b.evm.Source\x1a\t.evm.Json\"\x00\x12)\n\x06\x44\x65ploy\x12\r.evm.Contract\x1a\x0c.evm.Address\"\x00\x30\x01\x12(\n\x06SendTx\x12\x0f.evm.SendTxData\x1a\t.evm.Json\"\x00\x30\x01\x12/\n\x0bSendTxBatch\x12\x0f.evm.SendTxData\x1a\t.evm.Json\"\x00(\x01\x30\x01\x12H\n\x1dSendTxSequenceWithRevertProbe\x12\x0f.evm.SendTxData\x1a\x10.evm.TraceBundle\"\x00(\x01\x30\x01\x12*\n\x08Snapshot\x12\x0b.evm.Status\x1a\x0f.evm.SnapshotId\"\x00\x12\x32\n\x10RevertToSnapshot\x12\x0f.evm.SnapshotId\x1a\x0b.evm.Status\"\x00\x62\x06proto3')
 )
 
 
@@ -125,6 +125,105 @@ _JSON = _descriptor.Descriptor(
 )
 
 
+_CONTRACT = _descriptor.Descriptor(
+  name='Contract',
+  full_name='evm.Contract',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='bytecode', full_name='evm.Contract.bytecode', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=104,
+  serialized_end=132,
+)
+
+
+_ACCOUNTS_BALANCESENTRY = _descriptor.Descriptor(
+  name='BalancesEntry',
+  full_name='evm.Accounts.BalancesEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='evm.Accounts.BalancesEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='evm.Accounts.BalancesEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=_b('8\001'),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=193,
+  serialized_end=240,
+)
+
+_ACCOUNTS = _descriptor.Descriptor(
+  name='Accounts',
+  full_name='evm.Accounts',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='balances', full_name='evm.Accounts.balances', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_ACCOUNTS_BALANCESENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=134,
+  serialized_end=240,
+)
+
+
 _ADDRESS = _descriptor.Descriptor(
   name='Address',
   full_name='evm.Address',
@@ -151,8 +250,8 @@ _ADDRESS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=104,
-  serialized_end=130,
+  serialized_start=242,
+  serialized_end=268,
 )
 
 
@@ -210,15 +309,90 @@ _SENDTXDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=132,
-  serialized_end=221,
+  serialized_start=270,
+  serialized_end=359,
 )
 
+
+_SNAPSHOTID = _descriptor.Descriptor(
+  name='SnapshotId',
+  full_name='evm.SnapshotId',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='id', full_name='evm.SnapshotId.id', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=361,
+  serialized_end=385,
+)
+
+
+_TRACEBUNDLE = _descriptor.Descriptor(
+  name='TraceBundle',
+  full_name='evm.TraceBundle',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='normal', full_name='evm.TraceBundle.normal', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='reverted', full_name='evm.TraceBundle.reverted', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=387,
+  serialized_end=434,
+)
+
+_ACCOUNTS_BALANCESENTRY.containing_type = _ACCOUNTS
+_ACCOUNTS.fields_by_name['balances'].message_type = _ACCOUNTS_BALANCESENTRY
 DESCRIPTOR.message_types_by_name['Status'] = _STATUS
 DESCRIPTOR.message_types_by_name['Source'] = _SOURCE
 DESCRIPTOR.message_types_by_name['Json'] = _JSON
+DESCRIPTOR.message_types_by_name['Contract'] = _CONTRACT
+DESCRIPTOR.message_types_by_name['Accounts'] = _ACCOUNTS
 DESCRIPTOR.message_types_by_name['Address'] = _ADDRESS
 DESCRIPTOR.message_types_by_name['SendTxData'] = _SENDTXDATA
+DESCRIPTOR.message_types_by_name['SnapshotId'] = _SNAPSHOTID
+DESCRIPTOR.message_types_by_name['TraceBundle'] = _TRACEBUNDLE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 Status = _reflection.GeneratedProtocolMessageType('Status', (_message.Message,), dict(
@@ -242,6 +416,28 @@ Json = _reflection.GeneratedProtocolMessageType('Json', (_message.Message,), dic
   ))
 _sym_db.RegisterMessage(Json)
 
+Contract = _reflection.GeneratedProtocolMessageType('Contract', (_message.Message,), dict(
+  DESCRIPTOR = _CONTRACT,
+  __module__ = 'evm_pb2'
+  # @@protoc_insertion_point(class_scope:evm.Contract)
+  ))
+_sym_db.RegisterMessage(Contract)
+
+Accounts = _reflection.GeneratedProtocolMessageType('Accounts', (_message.Message,), dict(
+
+  BalancesEntry = _reflection.GeneratedProtocolMessageType('BalancesEntry', (_message.Message,), dict(
+    DESCRIPTOR = _ACCOUNTS_BALANCESENTRY,
+    __module__ = 'evm_pb2'
+    # @@protoc_insertion_point(class_scope:evm.Accounts.BalancesEntry)
+    ))
+  ,
+  DESCRIPTOR = _ACCOUNTS,
+  __module__ = 'evm_pb2'
+  # @@protoc_insertion_point(class_scope:evm.Accounts)
+  ))
+_sym_db.RegisterMessage(Accounts)
+_sym_db.RegisterMessage(Accounts.BalancesEntry)
+
 Address = _reflection.GeneratedProtocolMessageType('Address', (_message.Message,), dict(
   DESCRIPTOR = _ADDRESS,
   __module__ = 'evm_pb2'
@@ -256,7 +452,22 @@ SendTxData = _reflection.GeneratedProtocolMessageType('SendTxData', (_message.Me
   ))
 _sym_db.RegisterMessage(SendTxData)
 
+SnapshotId = _reflection.GeneratedProtocolMessageType('SnapshotId', (_message.Message,), dict(
+  DESCRIPTOR = _SNAPSHOTID,
+  __module__ = 'evm_pb2'
+  # @@protoc_insertion_point(class_scope:evm.SnapshotId)
+  ))
+_sym_db.RegisterMessage(SnapshotId)
+
+TraceBundle = _reflection.GeneratedProtocolMessageType('TraceBundle', (_message.Message,), dict(
+  DESCRIPTOR = _TRACEBUNDLE,
+  __module__ = 'evm_pb2'
+  # @@protoc_insertion_point(class_scope:evm.TraceBundle)
+  ))
+_sym_db.RegisterMessage(TraceBundle)
+
 
+_ACCOUNTS_BALANCESENTRY._options = None
 
 _EVM = _descriptor.ServiceDescriptor(
   name='EVM',
@@ -264,8 +475,8 @@ _EVM = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   serialized_options=None,
-  serialized_start=224,
-  serialized_end=429,
+  serialized_start=437,
+  serialized_end=869,
   methods=[
   _descriptor.MethodDescriptor(
     name='Reset',
@@ -282,7 +493,7 @@ _EVM = _descriptor.ServiceDescriptor(
     index=1,
     containing_service=None,
     input_type=_STATUS,
-    output_type=_JSON,
+    output_type=_ACCOUNTS,
     serialized_options=None,
   ),
   _descriptor.MethodDescriptor(
@@ -299,7 +510,7 @@ _EVM = _descriptor.ServiceDescriptor(
     full_name='evm.EVM.Deploy',
     index=3,
     containing_service=None,
-    input_type=_JSON,
+    input_type=_CONTRACT,
     output_type=_ADDRESS,
     serialized_options=None,
   ),
@@ -312,6 +523,42 @@ _EVM = _descriptor.ServiceDescriptor(
     output_type=_JSON,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='SendTxBatch',
+    full_name='evm.EVM.SendTxBatch',
+    index=5,
+    containing_service=None,
+    input_type=_SENDTXDATA,
+    output_type=_JSON,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='SendTxSequenceWithRevertProbe',
+    full_name='evm.EVM.SendTxSequenceWithRevertProbe',
+    index=6,
+    containing_service=None,
+    input_type=_SENDTXDATA,
+    output_type=_TRACEBUNDLE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Snapshot',
+    full_name='evm.EVM.Snapshot',
+    index=7,
+    containing_service=None,
+    input_type=_STATUS,
+    output_type=_SNAPSHOTID,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='RevertToSnapshot',
+    full_name='evm.EVM.RevertToSnapshot',
+    index=8,
+    containing_service=None,
+    input_type=_SNAPSHOTID,
+    output_type=_STATUS,
+    serialized_options=None,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_EVM)
 
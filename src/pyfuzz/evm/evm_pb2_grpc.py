@@ -21,7 +21,7 @@ class EVMStub(object):
     self.GetAccounts = channel.unary_stream(
         '/evm.EVM/GetAccounts',
         request_serializer=evm__pb2.Status.SerializeToString,
-        response_deserializer=evm__pb2.Json.FromString,
+        response_deserializer=evm__pb2.Accounts.FromString,
         )
     self.Compile = channel.unary_unary(
         '/evm.EVM/Compile',
@@ -30,7 +30,7 @@ class EVMStub(object):
         )
     self.Deploy = channel.unary_stream(
         '/evm.EVM/Deploy',
-        request_serializer=evm__pb2.Json.SerializeToString,
+        request_serializer=evm__pb2.Contract.SerializeToString,
         response_deserializer=evm__pb2.Address.FromString,
         )
     self.SendTx = channel.unary_stream(
@@ -38,6 +38,26 @@ class EVMStub(object):
         request_serializer=evm__pb2.SendTxData.SerializeToString,
         response_deserializer=evm__pb2.Json.FromString,
         )
+    self.SendTxBatch = channel.stream_stream(
+        '/evm.EVM/SendTxBatch',
+        request_serializer=evm__pb2.SendTxData.SerializeToString,
+        response_deserializer=evm__pb2.Json.FromString,
+        )
+    self.SendTxSequenceWithRevertProbe = channel.stream_stream(
+        '/evm.EVM/SendTxSequenceWithRevertProbe',
+        request_serializer=evm__pb2.SendTxData.SerializeToString,
+        response_deserializer=evm__pb2.TraceBundle.FromString,
+        )
+    self.Snapshot = channel.unary_unary(
+        '/evm.EVM/Snapshot',
+        request_serializer=evm__pb2.Status.SerializeToString,
+        response_deserializer=evm__pb2.SnapshotId.FromString,
+        )
+    self.RevertToSnapshot = channel.unary_unary(
+        '/evm.EVM/RevertToSnapshot',
+        request_serializer=evm__pb2.SnapshotId.SerializeToString,
+        response_deserializer=evm__pb2.Status.FromString,
+        )
 
 
 class EVMServicer(object):
@@ -79,6 +99,35 @@ class EVMServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def SendTxBatch(self, request_iterator, context):
+    """execute a sequence of transactions in order; one trace is returned per transaction
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def SendTxSequenceWithRevertProbe(self, request_iterator, context):
+    """execute a sequence of transactions, then execute it again with external calls reverted;
+    opts of the requests are ignored
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def Snapshot(self, request, context):
+    """take a snapshot of the current world state
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def RevertToSnapshot(self, request, context):
+    """restore a snapshot; option of the returned status is 1 on success
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
 
 def add_EVMServicer_to_server(servicer, server):
   rpc_method_handlers = {
@@ -90,7 +139,7 @@ def add_EVMServicer_to_server(servicer, server):
       'GetAccounts': grpc.unary_stream_rpc_method_handler(
           servicer.GetAccounts,
           request_deserializer=evm__pb2.Status.FromString,
-          response_serializer=evm__pb2.Json.SerializeToString,
+          response_serializer=evm__pb2.Accounts.SerializeToString,
       ),
       'Compile': grpc.unary_unary_rpc_method_handler(
           servicer.Compile,
@@ -99,7 +148,7 @@ def add_EVMServicer_to_server(servicer, server):
       ),
       'Deploy': grpc.unary_stream_rpc_method_handler(
           servicer.Deploy,
-          request_deserializer=evm__pb2.Json.FromString,
+          request_deserializer=evm__pb2.Contract.FromString,
           response_serializer=evm__pb2.Address.SerializeToString,
       ),
       'SendTx': grpc.unary_stream_rpc_method_handler(
@@ -107,6 +156,26 @@ def add_EVMServicer_to_server(servicer, server):
           request_deserializer=evm__pb2.SendTxData.FromString,
           response_serializer=evm__pb2.Json.SerializeToString,
       ),
+      'SendTxBatch': grpc.stream_stream_rpc_method_handler(
+          servicer.SendTxBatch,
+          request_deserializer=evm__pb2.SendTxData.FromString,
+          response_serializer=evm__pb2.Json.SerializeToString,
+      ),
+      'SendTxSequenceWithRevertProbe': grpc.stream_stream_rpc_method_handler(
+          servicer.SendTxSequenceWithRevertProbe,
+          request_deserializer=evm__pb2.SendTxData.FromString,
+          response_serializer=evm__pb2.TraceBundle.SerializeToString,
+      ),
+      'Snapshot': grpc.unary_unary_rpc_method_handler(
+          servicer.Snapshot,
+          request_deserializer=evm__pb2.Status.FromString,
+          response_serializer=evm__pb2.SnapshotId.SerializeToString,
+      ),
+      'RevertToSnapshot': grpc.unary_unary_rpc_method_handler(
+          servicer.RevertToSnapshot,
+          request_deserializer=evm__pb2.SnapshotId.FromString,
+          response_serializer=evm__pb2.Status.SerializeToString,
+      ),
   }
   generic_handler = grpc.method_handlers_generic_handler(
       'evm.EVM', rpc_method_handlers)
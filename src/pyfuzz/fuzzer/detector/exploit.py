@@ -20,12 +20,11 @@ class Exploit():
             "tx_list": self.txList
         }
 
+    def _key(self):
+        return (self.type, tuple(tx.hash if isinstance(tx, Transaction) else None for tx in self.txList))
+
     def __hash__(self):
-        import hashlib
-        m = hashlib.md5()
-        payload = str(self.__dict__())
-        m.update(payload.encode("utf-8"))
-        return int(m.hexdigest(), 16)
+        return hash(self._key())
 
     def __eq__(self, other):
-        return self.__class__ == self.__class__ and self.__repr__() == self.__repr__()
\ No newline at end of file
+        return self.__class__ == other.__class__ and self._key() == other._key()
@@ -9,6 +9,8 @@ from pyfuzz.config import TRAIN_CONFIG, DIR_CONFIG, FUZZ_CONFIG, CONCOLIC_CONFIG
 
 import logging
 from random import shuffle, randint, choice
+from concurrent.futures import ThreadPoolExecutor
+import copy
 import json
 import os
 
@@ -17,7 +19,7 @@ logger.setLevel(logging.INFO)
 
 
 class Fuzzer():
-    def __init__(self, evmEndPoint=None, opts={}):
+    def __init__(self, evmEndPoint=None, opts={}, evmPoolEndPoints=None):
         # load config
         self.opts = opts
         if "exploit" not in opts:
@@ -33,12 +35,23 @@ class Fuzzer():
             self.evm = EvmHandler(evmEndPoint)
         else:
             self.evm = EvmHandler()
+        # evm handlers executing mutations in parallel (see step_batch)
+        if evmPoolEndPoints:
+            self._evmPool = [EvmHandler(endPoint) for endPoint in evmPoolEndPoints]
+        else:
+            self._evmPool = [self.evm]
+        # created on the first step_batch over more than one evm
+        self._evmExecutor = None
         # contract properties
         self.filename = None
         self.contract = None
         self.contractAbi = None
         self.contractAnalysisReport = None
-        # contract cache. Each element is a dict {"name", "contract", "abi", "report", "visited"}
+        # function hash -> call feature of the static analysis report
+        self._callFeatureMap = {}
+        self._jumpCount = 0
+        # contract cache. Each element is a dict {"name", "contract", "abi", "report", "callFeatureMap", "visited", "jumpCount", "deployments", "mythril"}
+        # "deployments" maps an evm endpoint to (contract address, snapshot id right after deployment)
         self.contractMap = {}
         self.contractAddress = None
         # current state
@@ -49,14 +62,21 @@ class Fuzzer():
         self.maxCallNum = TRAIN_CONFIG["max_call_num"]
         self.actionNum = TRAIN_CONFIG["action_num"]
         # state and action processor
-        self.stateProcessor = StateProcessor()
-        self.actionProcessor = ActionProcessor()
+        self.stateProcessor = StateProcessor(maxCallNum=self.maxCallNum, maxFuncNum=self.maxFuncNum)
+        self.actionProcessor = ActionProcessor(maxCallNum=self.maxCallNum, maxFuncNum=self.maxFuncNum)
         # execution results
         self.traces = []
+        # found reports in order of discovery, and the same reports as a set for deduplication
         self.report = []
+        self._reportSet = set()
         # eth accounts
         self.accounts = self.evm.getAccounts()
-        self.defaultAccount = list(self.accounts.keys())[0]
+        # account addresses do not change during fuzzing
+        self._accountTuple = tuple(self.accounts)
+        self._accountCount = len(self._accountTuple)
+        self.defaultAccount = self._accountTuple[0]
+        # total balance of accounts right after deployment
+        self._initialBalTotal = self._accountCount * int(str(FUZZ_CONFIG["account_balance"]), 16)
         # analyzers
         self.traceAnalyzer = TraceAnalyzer(opts)
         self.staticAnalyzer = StaticAnalyzer()
@@ -67,8 +87,21 @@ class Fuzzer():
         # for test
         self.counter = 0
         # eth accounts as seeds of type address
-        with open(os.path.join(DIR_CONFIG["seed_dir"], 'address.json'), 'w') as f:
-            json.dump(list(self.accounts.keys()), f, indent="\t")
+        self.writeAddressSeeds()
+
+    def writeAddressSeeds(self):
+        """
+        write eth accounts to the seed file of type address unless it already holds them
+        """
+        seedFile = os.path.join(DIR_CONFIG["seed_dir"], 'address.json')
+        try:
+            with open(seedFile, 'r') as f:
+                if tuple(json.load(f)) == self._accountTuple:
+                    return
+        except (OSError, ValueError):
+            pass
+        with open(seedFile, 'w') as f:
+            json.dump(list(self._accountTuple), f, indent="\t")
 
     def refreshEvm(self):
         self.evm.reset()
@@ -78,42 +111,85 @@ class Fuzzer():
         self.seqLen = None
         self.traces = []
         self.report = []
+        self._reportSet = set()
         self.counter = 0
         self.filename = filename
         if filename in self.contractMap:
             # the contract is in cache
-            self.contract = self.contractMap[filename]["contract"]
-            self.contractMap[filename]["abi"] = ContractAbi(self.contract)
-            self.contractAbi = self.contractMap[filename]["abi"]
-            self.contractAnalysisReport = self.contractMap[filename]["report"]
-            self.mythrilConcolic = MythrilConcolic(self.contract["runtime_bytecode"], self.contractAbi)
+            cache = self.contractMap[filename]
+            self.contract = cache["contract"]
+            self.contractAbi = cache["abi"]
+            self.contractAnalysisReport = cache["report"]
+            self._callFeatureMap = cache["callFeatureMap"]
+            self._jumpCount = cache["jumpCount"]
+            if cache.get("mythril") is None:
+                cache["mythril"] = MythrilConcolic(self.contract["runtimeBytecode"], self.contractAbi)
+            self.mythrilConcolic = cache["mythril"]
             return True
         else:
             try:
                 with open(filename, "r",encoding="utf-8") as f:
                     source = f.read()
                 self.contract = self.evm.compile(source, contract_name)
-                contractAddress = self.evm.deploy(self.contract)
-                if not contractAddress:
+                self.contractAddress = self.evm.deploy(self.contract)
+                if not self.contractAddress:
                     return False
                 self.contractAbi = ContractAbi(self.contract)
                 # run static analysis
                 self.staticAnalyzer.load_contract(filename, contract_name)
                 self.contractAnalysisReport = self.staticAnalyzer.run()
+                self._callFeatureMap = self.buildCallFeatureMap(self.contractAnalysisReport)
+                self._jumpCount = self.countJumps(self.contract)
                 # set cache
                 self.contractMap[filename] = {
                     "name": contract_name,
                     "contract": self.contract,
                     "abi": self.contractAbi,
                     "report": self.contractAnalysisReport,
-                    "visited": set([])
+                    "callFeatureMap": self._callFeatureMap,
+                    "visited": set([]),
+                    "jumpCount": self._jumpCount,
+                    "deployments": {self.evm.endpoint: (self.contractAddress, self.evm.snapshot())}
                 }
                 self.mythrilConcolic = MythrilConcolic(self.contract["runtimeBytecode"], self.contractAbi)
+                self.contractMap[filename]["mythril"] = self.mythrilConcolic
                 return True
             except Exception as e:
                 logger.exception("fuzz.loadContract: {}".format(str(e)))
                 return False
 
+    @staticmethod
+    def countJumps(contract):
+        """
+        number of jump opcodes in a compiled contract, the denominator of coverage
+        """
+        jump_cnt = 0
+        try:
+            jump_cnt = contract["opcodes"].count("JUMP")
+        except:
+            pass
+        return jump_cnt
+
+    @staticmethod
+    def buildCallFeatureMap(report):
+        return {funcHash: encoded["features"][0] for funcHash, encoded in report.encoded_report.items()}
+
+    def restoreContract(self, evm=None):
+        """
+        restore evm (the main handler by default) to the state right after the current contract was deployed;
+        redeploy it if the cached snapshot is no longer available. Return the contract address
+        """
+        if evm is None:
+            evm = self.evm
+        deployments = self.contractMap[self.filename]["deployments"]
+        address, snapshotId = deployments.get(evm.endpoint, (None, None))
+        if snapshotId is None or not evm.revertToSnapshot(snapshotId):
+            address = evm.deploy(self.contract)
+            deployments[evm.endpoint] = (address, evm.snapshot())
+        if evm is self.evm:
+            self.contractAddress = address
+        return address
+
     def runOneTx(self, tx, opts={}):
         if self.contract == None:
             logger.exception("Contract have not been loaded.")
@@ -124,38 +200,63 @@ class Fuzzer():
             trace = []
         return trace
 
-    def runTxs(self, txList):
-        self.contractAddress = self.evm.deploy(self.contract)
-        traces = []
-        opts = {}
+    def runTxs(self, txList, evm=None):
+        calls, sentTxs = self.prepareTxs(txList)
+        self.visitFunctions(txList)
+        return self.executeTxs(txList, calls, sentTxs, evm)
+
+    def visitFunctions(self, txList):
+        """
+        update visit counters of the called functions in the contract abi
+        """
+        abi = self.contractMap[self.filename]["abi"]
+        for tx in txList:
+            if tx:
+                abi.updateVisited(tx.hash)
+
+    def prepareTxs(self, txList):
+        """
+        update visit counters of the transactions themselves.
+        Return call features of txList and (sender, value, payload) of each non-empty transaction
+        """
         calls = []
+        sentTxs = []
 
         for tx in txList:
             if not tx:
                 calls.append(0)
-                traces.append([])
                 continue
-            if tx.hash in self.contractAnalysisReport.encoded_report:
-                calls.append(self.contractAnalysisReport.encoded_report[tx.hash]["features"][0])
-            else:
-                calls.append(0)
+            calls.append(self._callFeatureMap.get(tx.hash, 0))
             tx.updateVisited()
-            self.contractMap[self.filename]["abi"].updateVisited(tx.hash)
-            trace = self.runOneTx(tx, opts)
+            sentTxs.append((tx.sender, str(tx.value), tx.payload))
+        return calls, sentTxs
+
+    def executeTxs(self, txList, calls, sentTxs, evm=None):
+        """
+        execute transactions prepared by prepareTxs on evm (the main handler by default),
+        starting from the freshly deployed contract
+        """
+        if evm is None:
+            evm = self.evm
+        contractAddress = self.restoreContract(evm)
+        sentTxs = [(sender, contractAddress, value, payload) for sender, value, payload in sentTxs]
+        traces = []
+
+        # execute all transactions in one streaming call
+        if sum(calls) > 0:
+            # if there is any call, the server executes the transactions again with all calls reverted
+            sentTraces, revertedTraces = evm.sendTxBatchWithRevertProbe(sentTxs)
+        else:
+            sentTraces, revertedTraces = (evm.sendTxBatch(sentTxs) if sentTxs else []), []
+        sentTraces = iter(sentTraces)
+        for tx in txList:
+            trace = next(sentTraces) if tx else None
             if not trace:
                 trace = []
             traces.append(trace)
-        
-        # if there is any call
-        if sum(calls) > 0:
-            # revert all calls when executing transactions
-            opts["revert"] = True
-            for tx in txList:
-                if not tx:
-                    continue
-                trace = self.runOneTx(tx, opts)
-                if trace:
-                    traces.append(trace)
+        for trace in revertedTraces:
+            if trace:
+                traces.append(trace)
         return traces
 
     def loadSeed(self, txList, visited, more_seeds=[]):
@@ -198,8 +299,22 @@ class Fuzzer():
                     logger.debug("load seed", seed)
         return new_path_flag
 
+    def findNewPath(self, txList, visited):
+        """
+        whether loadSeed would find a new path in the execution of a tx list, without updating anything
+        """
+        visitedList = self.contractMap[self.filename]["visited"]
+        for i in range(len(txList)):
+            if not txList[i]:
+                continue
+            if not self.opts["path-coverage"] and not visited[i].issubset(visitedList):
+                return True
+            if self.opts["path-coverage"] and visited[i] not in visitedList:
+                return True
+        return False
+
     def mutate(self, state, action):
-        txList = state.txList + []
+        txList = state.txList.copy()
         actionId = action.actionId
         actionArg = action.actionArg
         txHash = None
@@ -210,11 +325,7 @@ class Fuzzer():
             txHash = txList[actionArg].hash
 
         # get Seeds
-        hashList = []
-        for tx in txList:
-            if not tx:
-                continue
-            hashList.append(tx.hash)
+        hashList = [tx.hash for tx in state.txList if tx]
         seeds = self.contractAbi.getSeeds(hashList)
 
         # manual checks
@@ -228,39 +339,47 @@ class Fuzzer():
         logger.debug("checked action", actionId, actionArg)
 
         # modify
+        contractAbi = self.contractAbi
         if actionId == 0:
             funcHash = txHash
-            if len(self.contractAbi.funcHashList) <= 0 or (len(self.contractAbi.funcHashList) == 1 and txHash in self.contractAbi.funcHashList):
+            funcHashList = contractAbi.funcHashList
+            if len(funcHashList) <= 0 or (len(funcHashList) == 1 and txHash in funcHashList):
                 return None
             candidateFunc = []
-            for funcHash in self.contractAbi.funcHashList:
-                if funcHash == txHash or not funcHash in self.contractAnalysisReport.func_map:
+            funcMap = self.contractAnalysisReport.func_map
+            # variables read by the following transactions do not depend on the candidate
+            read_set = set().union(*(funcMap[tx.hash]._vars_read
+                                     for tx in state.txList[actionArg + 1:TRAIN_CONFIG["max_call_num"]]
+                                     if isinstance(tx, Transaction) and tx.hash in funcMap))
+            for funcHash in funcHashList:
+                if funcHash == txHash:
+                    continue
+                funcInfo = funcMap.get(funcHash)
+                if funcInfo is None:
                     continue
-                if self.contractAnalysisReport.func_map[funcHash].features["call"] > 0:
+                if funcInfo.features["call"] > 0:
                     candidateFunc.append(funcHash)
                     continue
-                read_set = set()
-                write_set = set(self.contractAnalysisReport.func_map[funcHash]._vars_written)
-                for i in range(actionArg + 1, TRAIN_CONFIG["max_call_num"]):
-                    if not isinstance(state.txList[i], Transaction):
-                        continue
-                    tmp_hash = state.txList[i].hash
-                    if tmp_hash in self.contractAnalysisReport.func_map:
-                        read_set = read_set.union(self.contractAnalysisReport.func_map[tmp_hash]._vars_read)
-                if len(read_set.intersection(write_set)) > 0:
+                if not read_set.isdisjoint(funcInfo._vars_written):
                     candidateFunc.append(funcHash)
                     continue
 
             if len(candidateFunc) == 0:
                 return None
             selectedFuncHash = choice(candidateFunc)
-            tx = self.contractAbi.generateTx(selectedFuncHash, self.defaultAccount, seeds)
+            tx = contractAbi.generateTx(selectedFuncHash, self.defaultAccount, seeds)
             txList[actionArg] = tx
         elif actionId == 1:
             # modify args
             if txHash == None:
                 return None
-            txList[actionArg].args = self.contractAbi.generateTxArgs(txHash, seeds)
+            args = state.txList[actionArg].args
+            newArgs = args
+            # the first draw usually differs from the current arguments
+            for newArgs in contractAbi.iterTxArgs(txHash, seeds, FUZZ_CONFIG["mutation_candidate_num"]):
+                if newArgs != args:
+                    break
+            txList[actionArg].args = newArgs
         elif actionId == 2:
             # modify sender
             if txHash == None:
@@ -268,23 +387,22 @@ class Fuzzer():
             sender = state.txList[actionArg].sender
             attempt = 100
             while sender == state.txList[actionArg].sender and attempt > 0:
-                randIndex = randint(0, len(self.accounts.keys())-1)
-                sender = list(self.accounts.keys())[randIndex]
+                sender = self._accountTuple[randint(0, self._accountCount-1)]
                 attempt -= 1
             txList[actionArg].sender = sender
         elif actionId == 3:
             # modify value
             if txHash == None:
                 return None
-            if not self.contractAbi.interface[txHash]['payable']:
+            if not contractAbi.payable[txHash]:
                 # not payable function
                 return None
             value = state.txList[actionArg].value
-            attempt = 100
-            while value == state.txList[actionArg].value and attempt > 0:
-                value = self.contractAbi.generateTxValue(txHash, seeds)
-                attempt -= 1
-            txList[actionArg].value = value
+            newValue = value
+            for newValue in contractAbi.iterTxValues(txHash, seeds, FUZZ_CONFIG["mutation_candidate_num"]):
+                if newValue != value:
+                    break
+            txList[actionArg].value = newValue
         else:
             return None
         return State(state.staticAnalysis, txList)
@@ -297,12 +415,13 @@ class Fuzzer():
         if not self.contract:
             logger.exception("Contract not inintialized in fuzzer.")
             return None, None
-        self.contractAddress = self.evm.deploy(self.contract)
+        self.restoreContract()
 
         self.state = State(self.contractAnalysisReport, [
                            None for i in range(self.maxCallNum)])
         self.traces = []
         self.report = []
+        self._reportSet = set()
         state, seqLen = self.stateProcessor.encodeState(self.state)
         return state, seqLen
 
@@ -366,32 +485,11 @@ class Fuzzer():
                 return state, seqLen, reward, done, timeout
             # execute transactions
             traces = self.runTxs(nextState.txList)
+            # query balances while the traces are analyzed
+            accountsCall = self.evm.requestAccounts() if self.opts["exploit"] else None
             # get reward of executions
-            reward, report, pcs, seeds, paths = self.traceAnalyzer.run(self.traces, traces)
+            reward, report = self.evaluate(nextState, traces, accountsCall)
             self.traces = traces
-            # bonus for valid mutation
-            reward += FUZZ_CONFIG["valid_mutation_reward"]
-            # update seeds
-            tmp_visited = paths if self.opts["path-coverage"] else pcs
-            if self.loadSeed(nextState.txList, tmp_visited, seeds):
-                reward += FUZZ_CONFIG["path_discovery_reward"]
-            # check whether exploitation happens
-            if self.opts["exploit"]:
-                self.accounts = self.evm.getAccounts()
-                # balance increase
-                bal_p = 0
-                bal = 0
-                for acc in self.accounts.keys():
-                    bal_p += int(str(FUZZ_CONFIG["account_balance"]), 16)
-                    bal += int(str(self.accounts[acc]), 16)
-
-                if bal > bal_p:
-                    reward += FUZZ_CONFIG["exploit_reward"]
-                    report.append(Exploit("BalanceIncrement", nextState.txList))
-            # fill in transasactions for exploitation
-            for rep in report:
-                if isinstance(rep, Exploit):
-                    rep.txList = nextState.txList
             # testing
             if len(report) > 0:
                 done = 1
@@ -405,7 +503,7 @@ class Fuzzer():
             self.state = nextState
             self.traces = traces
             # should exclude repeated reports
-            self.report = list(set(self.report + report))
+            self.addReports(report)
             state, seqLen = self.stateProcessor.encodeState(self.state)
             _, _, jumpi, _= self.traceAnalyzer.path_variaty(self.traces, self.traces)
             print(self.coverage(), jumpi)
@@ -415,19 +513,163 @@ class Fuzzer():
             state, seqLen = self.stateProcessor.encodeState(self.state)
             return state, seqLen, 0, 0, 1
 
+    def evaluate(self, nextState, traces, accountsCall=None):
+        """
+        reward the execution of nextState against the traces of the current state
+        and update seeds. accountsCall is a pending requestAccounts() call of the evm that ran nextState.
+        Return reward and found vulnerabilities or exploitations
+        """
+        reward, report, execution = self.scoreExecution(nextState, traces, accountsCall)
+        self.applyExecution(nextState, execution)
+        return reward, report
+
+    def scoreExecution(self, nextState, traces, accountsCall=None):
+        """
+        evaluate() without its side effects. Return reward, found vulnerabilities or exploitations,
+        and (visited, seeds, accounts) of the execution to be applied by applyExecution
+        """
+        reward, report, pcs, seeds, paths = self.traceAnalyzer.run(self.traces, traces)
+        # bonus for valid mutation
+        reward += FUZZ_CONFIG["valid_mutation_reward"]
+        # reward new paths
+        tmp_visited = paths if self.opts["path-coverage"] else pcs
+        if self.findNewPath(nextState.txList, tmp_visited):
+            reward += FUZZ_CONFIG["path_discovery_reward"]
+        # check whether exploitation happens
+        accounts = None
+        if self.opts["exploit"]:
+            accounts = self.evm.getAccounts(call=accountsCall)
+            # balance increase
+            bal = sum(int(balance, 16) for balance in accounts.values())
+            if bal > self._initialBalTotal:
+                reward += FUZZ_CONFIG["exploit_reward"]
+                report.append(Exploit("BalanceIncrement", nextState.txList))
+        # fill in transasactions for exploitation
+        for rep in report:
+            if isinstance(rep, Exploit):
+                rep.txList = nextState.txList
+        return reward, report, (tmp_visited, seeds, accounts)
+
+    def applyExecution(self, nextState, execution):
+        """
+        update seeds, visited paths and balances with an execution scored by scoreExecution
+        """
+        tmp_visited, seeds, accounts = execution
+        self.loadSeed(nextState.txList, tmp_visited, seeds)
+        if accounts is not None:
+            self.accounts = accounts
+
+    def addReports(self, report):
+        """
+        append reports which have not been found before
+        """
+        for rep in report:
+            if rep not in self._reportSet:
+                self._reportSet.add(rep)
+                self.report.append(rep)
+
+    def runTxsOnPool(self, evm, jobs):
+        """
+        execute prepared (txList, calls, sentTxs) jobs one after another on one evm of the pool
+        """
+        results = []
+        for txList, calls, sentTxs in jobs:
+            traces = self.executeTxs(txList, calls, sentTxs, evm)
+            accountsCall = evm.requestAccounts() if self.opts["exploit"] else None
+            if accountsCall is not None:
+                # read the balances before the evm runs the next job
+                accountsCall = list(accountsCall)
+            results.append((traces, accountsCall))
+        return results
+
+    @staticmethod
+    def assignJobs(jobNum, poolSize):
+        """
+        round-robin job indices over a pool of poolSize evms. Return the job indices of each evm
+        """
+        return [list(range(k, jobNum, poolSize)) for k in range(poolSize)]
+
+    def step_batch(self, actions):
+        """
+        apply several actions to the current state and execute the mutations in parallel on the evm pool.
+        Each action mutates its own copy of the current state and is rewarded as in step(), against the
+        seeds and paths known before the batch; the fuzzer then moves to the mutation with the highest
+        reward, and only its seeds, paths, balances and function visit counters are kept.
+        A due concolic execution replaces the batch, as it replaces the mutation in step(): its result is
+        returned for the first action, and the other actions get the result of a failed mutation.
+        Return a list of (state, seqLen, reward, done, timeout) in the order of actions
+        """
+        if actions and self.opts["concolic"] and self.concolicCnt >= self.concolicWait:
+            result = self.step(actions[0])
+            state, seqLen, _, _, timeout = result
+            return [result] + [(state, seqLen, 0, 0, timeout) for _ in actions[1:]]
+        self.counter += len(actions)
+        timeout = 1 if self.counter >= FUZZ_CONFIG["max_attempt"] else 0
+        p_coverage = self.coverage()
+        try:
+            nextStates = []
+            for action in actions:
+                # transactions are modified in place by mutate, so every candidate gets its own copies
+                state = State(self.state.staticAnalysis, [copy.copy(tx) if tx else None for tx in self.state.txList])
+                nextStates.append(self.mutate(state, self.actionProcessor.decodeAction(action)))
+
+            # round-robin the mutations over the pool; each evm runs its share sequentially
+            valid = [i for i, nextState in enumerate(nextStates) if nextState]
+            jobs = []
+            for i in valid:
+                calls, sentTxs = self.prepareTxs(nextStates[i].txList)
+                jobs.append((nextStates[i].txList, calls, sentTxs))
+            assignment = self.assignJobs(len(jobs), len(self._evmPool))
+            executions = [None for _ in nextStates]
+            if len(self._evmPool) == 1:
+                outputs = [self.runTxsOnPool(self._evmPool[0], jobs)]
+            else:
+                if self._evmExecutor is None:
+                    self._evmExecutor = ThreadPoolExecutor(max_workers=len(self._evmPool))
+                futures = [self._evmExecutor.submit(self.runTxsOnPool, evm, [jobs[k] for k in indices])
+                           for evm, indices in zip(self._evmPool, assignment)]
+                outputs = [future.result() for future in futures]
+            for indices, output in zip(assignment, outputs):
+                for k, execution in zip(indices, output):
+                    executions[valid[k]] = execution
+
+            results = []
+            best = None
+            for i, nextState in enumerate(nextStates):
+                if not nextState:
+                    state, seqLen = self.stateProcessor.encodeState(self.state)
+                    results.append((state, seqLen, 0, 0, timeout))
+                    continue
+                traces, accountsCall = executions[i]
+                reward, report, execution = self.scoreExecution(nextState, traces, accountsCall)
+                done = 1 if len(report) > 0 else 0
+                self.addReports(report)
+                state, seqLen = self.stateProcessor.encodeState(nextState)
+                results.append((state, seqLen, reward, done, timeout))
+                if best is None or reward > best[0]:
+                    best = (reward, nextState, traces, execution)
+
+            if best:
+                _, self.state, self.traces, execution = best
+                self.applyExecution(self.state, execution)
+                self.visitFunctions(self.state.txList)
+                if p_coverage == self.coverage():
+                    self.concolicCnt += 1
+                else:
+                    self.concolicCnt = 0
+                    self.concolicWait = int(self.concolicWait * CONCOLIC_CONFIG["concolic_penalty"])
+            return results
+        except Exception as e:
+            logger.error("fuzzer.step_batch: {}".format(str(e)))
+            state, seqLen = self.stateProcessor.encodeState(self.state)
+            return [(state, seqLen, 0, 0, 1) for _ in actions]
+
     def coverage(self):
         if self.opts["path-coverage"]:
             return len(self.contractMap[self.filename]["visited"])
-        jump_cnt = 0
-        try:
-            jump_cnt = self.contract["opcodes"].count("JUMP")
-        except:
-            pass
-
-        if jump_cnt == 0:
+        if self._jumpCount == 0:
             return 1
-        else:
-            return len(self.contractMap[self.filename]["visited"]) / jump_cnt
+        return len(self.contractMap[self.filename]["visited"]) / self._jumpCount
 
     def printTxList(self):
         print("TX LIST:")
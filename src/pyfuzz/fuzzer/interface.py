@@ -5,6 +5,8 @@ from pyfuzz.config import FUZZ_CONFIG
 
 
 class Transaction:
+    __slots__ = ("hash", "args", "value", "sender", "abi", "tmp_visited", "total_visited")
+
     def __init__(self, hash, args, value, sender, abi, total_visited=0, tmp_visited=0):
         self.hash = hash
         self.args = args
@@ -45,7 +47,10 @@ class ContractAbi:
 
     def __init__(self, contract=None):
         self.interface = {}
-        self.funcHashList = []
+        # function hashes in abi order, frozen into a tuple once the abi is loaded
+        self.funcHashList = ()
+        # function hash -> payable flag
+        self.payable = {}
         self.functionHashes = None
         self.typeHandlers = {}
         self.visited = {}
@@ -62,12 +67,14 @@ class ContractAbi:
         solcAbi = json.loads(contract["interface"])
         hashes = contract["functionHashes"]
         self.functionHashes = hashes
+        funcHashList = list(self.funcHashList)
         for abi in solcAbi:
             if abi["type"] == "fallback":
                 abi["inputs"] = []
                 self.interface[""] = abi
                 self.visited[""] = 0
-                self.funcHashList.append("")
+                self.payable[""] = bool(abi.get("payable"))
+                funcHashList.append("")
                 continue
             if abi["type"] != "function":
                 continue
@@ -88,7 +95,9 @@ class ContractAbi:
                 self.interface[sig] = abi
                 self.visited[sig] = 0
                 self.typeHandlers[sig] = TypeHandler()
-                self.funcHashList.append(sig)
+                self.payable[sig] = bool(abi.get("payable"))
+                funcHashList.append(sig)
+        self.funcHashList = tuple(funcHashList)
 
     def getSeeds(self, hashList):
         res = TypeHandler().seeds
@@ -117,17 +126,44 @@ class ContractAbi:
         assert(self.interface[hash] != None)
         inputAbi = self.interface[hash]["inputs"]
         value = 0
-        if self.interface[hash]['payable']:
+        if self.payable[hash]:
             value = self.typeHandlers[hash].fuzzByType("payment", FUZZ_CONFIG["seed_prob"], seeds)
         return value
 
+    def iterTxArgs(self, hash, seeds=None, k=1):
+        """
+        lazily generate up to k argument lists; a function without inputs has only one
+        """
+        assert(self.interface[hash] != None)
+        inputTypes = [abi["type"] for abi in self.interface[hash]["inputs"]]
+        if not inputTypes:
+            yield []
+            return
+        fuzzByType = self.typeHandlers[hash].fuzzByType
+        seedProb = FUZZ_CONFIG["seed_prob"]
+        for _ in range(k):
+            yield [fuzzByType(_type, seedProb, seeds) for _type in inputTypes]
+
+    def iterTxValues(self, hash, seeds=None, k=1):
+        """
+        lazily generate up to k values; a non-payable function has only one
+        """
+        assert(self.interface[hash] != None)
+        if not self.payable[hash]:
+            yield 0
+            return
+        fuzzByType = self.typeHandlers[hash].fuzzByType
+        seedProb = FUZZ_CONFIG["seed_prob"]
+        for _ in range(k):
+            yield fuzzByType("payment", seedProb, seeds)
+
     """
         Input: function hash
         Output: transaction
     """
     def generateTx(self, hash, sender, seeds=None):
         args = self.generateTxArgs(hash, seeds)
-        if self.interface[hash]['payable']:
+        if self.payable[hash]:
             value = self.generateTxValue(hash, seeds)
         else:
             value = 0
@@ -2,13 +2,20 @@ from pyfuzz.fuzzer.detector.detector import Detector
 from pyfuzz.fuzzer.detector.vulnerability import Vulnerability
 from pyfuzz.fuzzer.detector.exploit import Exploit
 from pyfuzz.config import FUZZ_CONFIG
+from collections import OrderedDict
 
 branch_op = ["JUMP", "JUMPI", "JUMPDEST", "STOP", "REVERT"]
 call_op = ["CALL", "CALLCODE", "DELEGATECALL", "SELFDESTRUCT"]
+branch_op_set = frozenset(branch_op)
+# number of trace lists whose summaries are kept by TraceAnalyzer: the current and the previous execution
+summary_cache_size = 2
+
 
 class TraceAnalyzer:
     def __init__(self, opts={}):
         self.detector = Detector(opts)
+        # id(traces) -> (traces, summary); see summarize
+        self._summary_cache = OrderedDict()
 
     """
         input:
@@ -50,39 +57,48 @@ class TraceAnalyzer:
             trace_id += 1
         return seeds
 
-    def path_variaty(self, ptraces, ctraces):
-        pJumps = []
-        cJumps = []
+    def summarize(self, traces):
+        """
+        return jump pcs of all traces (set), jump pcs of each trace, JUMPI pcs and path hash of each trace.
+        Summaries are cached by identity of the trace list, which must not be modified after being analyzed
+        """
+        entry = self._summary_cache.get(id(traces))
+        if entry is not None and entry[0] is traces:
+            # keep the previous execution cached while step_batch rewards its candidates
+            self._summary_cache.move_to_end(id(traces))
+            return entry[1]
         ret_jumps = []
-        ret_jumpi = []
+        ret_jumpi = set()
         ret_paths = []
-        for ptrace in ptraces:
-            for state in ptrace:
-                if state["op"] in branch_op:
-                    pJumps.append(state["pc"])
-        for ctrace in ctraces:
-            tmp_jumps = []
-            tmp_path = ""
-            for state in ctrace:
-                tmp_path += hex(state["pc"])[2:]
-                if state["op"] in branch_op:
-                    tmp_jumps.append(state["pc"])
-                    cJumps.append(state["pc"])
+        for trace in traces:
+            tmp_jumps = set()
+            tmp_path = []
+            for state in trace:
+                tmp_path.append(hex(state["pc"])[2:])
+                if state["op"] in branch_op_set:
+                    tmp_jumps.add(state["pc"])
                     if state["op"] == "JUMPI":
-                        ret_jumpi.append(state["pc"])
-            ret_jumps.append(set(tmp_jumps))
-            ret_paths.append(hash(tmp_path))
+                        ret_jumpi.add(state["pc"])
+            ret_jumps.append(tmp_jumps)
+            ret_paths.append(hash("".join(tmp_path)))
+        summary = (set().union(*ret_jumps), ret_jumps, list(ret_jumpi), ret_paths)
+        self._summary_cache[id(traces)] = (traces, summary)
+        if len(self._summary_cache) > summary_cache_size:
+            self._summary_cache.popitem(last=False)
+        return summary
 
-        pJumps = list(set(pJumps))
-        cJumps = list(set(cJumps))
-        difJumps = list(set(pJumps + cJumps))
-        ret_jumpi = list(set(ret_jumpi))
-
-        # print(difJumps, pJumps, cJumps)
-        if len(difJumps) == 0:
+    def path_variaty(self, ptraces, ctraces):
+        cJumps, ret_jumps, ret_jumpi, ret_paths = self.summarize(ctraces)
+        if ptraces is ctraces:
+            # no jump is visited by only one of the executions
             reward = 0
         else:
-            comJumpNum = len(pJumps) + len(cJumps) - len(difJumps)
-            reward = (len(pJumps) + len(cJumps) -
-                      2 * comJumpNum) / len(difJumps)
-        return reward, ret_jumps, ret_jumpi, ret_paths
\ No newline at end of file
+            pJumps, _, _, _ = self.summarize(ptraces)
+            # share of jumps visited by only one of the executions
+            comJumpNum = len(pJumps & cJumps)
+            difJumpNum = len(pJumps) + len(cJumps) - comJumpNum
+            if difJumpNum == 0:
+                reward = 0
+            else:
+                reward = (len(pJumps) + len(cJumps) - 2 * comJumpNum) / difJumpNum
+        return reward, ret_jumps, ret_jumpi, ret_paths
@@ -25,10 +25,19 @@ def test():
     print("\nTesting deploy\n")
     address = evm.deploy(contract)
     print(address)
+    print("\nTesting snapshot\n")
+    snapshotId = evm.snapshot()
+    print(snapshotId)
     print("\nTesting sendTx\n")
     trace = evm.sendTx(list(accounts.keys())[0], address, "0", contract["functionHashes"]["test1(uint256)"] + "0" * 32)
     for t in trace:
         print(t["op"], end=" ")
+    print("\nTesting sendTxBatch\n")
+    payload = contract["functionHashes"]["test1(uint256)"] + "0" * 32
+    traces = evm.sendTxBatch([(list(accounts.keys())[0], address, "0", payload)] * 2)
+    print(len(traces), [len(t) if t else 0 for t in traces])
+    print("\nTesting revertToSnapshot\n")
+    print(evm.revertToSnapshot(snapshotId))
     print("\nTesting getAccounts:\n")
     accounts = evm.getAccounts()
     print(accounts)
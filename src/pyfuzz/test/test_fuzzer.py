@@ -35,6 +35,24 @@ def test_exploit(datadir, filename):
         print("visited:", fuzzer.contractMap[filename]["visited"])
         print("accounts:", fuzzer.accounts)
 
+def test_batch():
+    print("Testing assignJobs...")
+    # expect [[0, 2, 4], [1, 3]]
+    print(Fuzzer.assignJobs(5, 2))
+    filename = os.path.join(os.path.dirname(__file__), '../test/contracts/Test.sol')
+    fuzzer = Fuzzer()
+    fuzzer.loadContract(filename, "Test")
+    print("Reset...")
+    fuzzer.reset()
+    for i in range(5):
+        actions = [randint(0, TRAIN_CONFIG["action_num"]-1) for _ in range(4)]
+        print("Actions", actions)
+        results = fuzzer.step_batch(actions)
+        for action, (state, seqLen, reward, done, timeout) in zip(actions, results):
+            print("action:", action, "reward:", reward, "done:", done)
+        fuzzer.printTxList()
+        print("visited:", fuzzer.contractMap[filename]["visited"])
+
 if __name__ == "__main__":
     # test()
     test_exploit("/home/zqz/contracts", "0x1ac1c4c67181bb4d3c0a7d9dd2cda5d9692a364d#Boom.sol")
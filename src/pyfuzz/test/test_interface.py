@@ -12,6 +12,8 @@ def test():
     func_hash = contract["functionHashes"]["test1(uint256)"]
     tx = Transaction(func_hash, [12345], "1212", "0x123123123123", abi.interface[func_hash])
     print(tx.payload)
+    print(list(abi.iterTxArgs(func_hash, None, 4)))
+    print(list(abi.iterTxValues(func_hash, None, 4)))
 
 if __name__ == "__main__":
     test()
\ No newline at end of file
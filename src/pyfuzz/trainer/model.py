@@ -20,10 +20,12 @@ class ActionProcessor:
         from 1 to maxCallNum * 4
     """
 
-    def __init__(self):
-        self.maxFuncNum = TRAIN_CONFIG["max_func_num"]
-        self.maxCallNum = TRAIN_CONFIG["max_call_num"]
-        self.actionNum = TRAIN_CONFIG["action_num"]
+    def __init__(self, maxCallNum=None, maxFuncNum=None):
+        self.maxFuncNum = maxFuncNum or TRAIN_CONFIG["max_func_num"]
+        self.maxCallNum = maxCallNum or TRAIN_CONFIG["max_call_num"]
+        self.actionNum = self.maxCallNum * len(actionList)
+        # decoded actions are fixed by the dimensions
+        self.actions = tuple(Action(action % len(actionList), action // len(actionList)) for action in range(self.actionNum))
 
     def encodeAction(self, actionObj):
         actionId = actionObj.actionId
@@ -34,7 +36,7 @@ class ActionProcessor:
 
     def decodeAction(self, action):
         assert(action >= 0 and action < self.actionNum)
-        return Action(action % len(actionList), action // len(actionList))
+        return self.actions[action]
 
 
 class State:
@@ -51,64 +53,58 @@ class StateProcessor:
          [static analysis of func y, transaction or zeros]]
     """
 
-    def __init__(self):
-        self.maxFuncNum = TRAIN_CONFIG["max_func_num"]
-        self.maxCallNum = TRAIN_CONFIG["max_call_num"]
+    def __init__(self, maxCallNum=None, maxFuncNum=None):
+        self.maxFuncNum = maxFuncNum or TRAIN_CONFIG["max_func_num"]
+        self.maxCallNum = maxCallNum or TRAIN_CONFIG["max_call_num"]
         self.maxFuncArg = TRAIN_CONFIG["max_func_arg"]
         self.sequence = None
         self.txNum = None
         self.seqLen = TRAIN_CONFIG["max_line_length"]
+        # encoding constants fixed by the dimensions
+        self.featureSize = TRAIN_CONFIG["feature_size"]
+        self.tokenSize = TRAIN_CONFIG["token_size"]
+        self.emptyLine = np.zeros(self.seqLen, dtype=np.uint8)
+        self.emptyStatic = {
+            "taint": [0 for i in range(ANALYSIS_CONFIG["max_length"])],
+            "features": [0 for i in range(ANALYSIS_CONFIG["feature_num"])]
+        }
+
+    def encodeTx(self, tx, txStatic):
+        """
+        one-hot encode features, taint tokens and visit counters of a transaction into one line.
+        Same as concatenating intToOnehot of every value, truncated or zero-padded to seqLen
+        """
+        txLine = np.zeros(self.seqLen, dtype=np.uint8)
+        offset = 0
+        for values, size in ((txStatic["features"], self.featureSize),
+                             (txStatic["taint"], self.tokenSize),
+                             ((tx.tmp_visited, tx.total_visited), self.tokenSize)):
+            for num in values:
+                assert(num >= 0)
+                if num > 0 and offset + size - min(num, size) < self.seqLen:
+                    txLine[offset + size - min(num, size)] = 1
+                offset += size
+        return txLine
 
     def encodeState(self, stateObj):
         staticAnalysis = stateObj.staticAnalysis
         txList = stateObj.txList
         self.txNum = len(txList)
-        funcHashes = list(staticAnalysis.encoded_report.keys())
+        encodedReport = staticAnalysis.encoded_report
 
         # encoding
-        self.sequence = np.array(
-            [[0 for _ in range(self.seqLen)]], dtype=np.uint8)
-
+        lines = []
         for tx in txList:
             if not tx:
-                txLine = np.array([0 for i in range(self.sequence.shape[1])], dtype=np.uint8)
-                self.sequence = np.append(
-                    self.sequence, np.expand_dims(txLine, axis=0), axis=0)
+                lines.append(self.emptyLine)
                 continue
-            if self.sequence.shape[0] > self.maxCallNum:
+            if len(lines) >= self.maxCallNum:
                 break
-            txLine = []
-            if tx.hash not in staticAnalysis.encoded_report:
-                txStatic = {
-                    "taint": [0 for i in range(ANALYSIS_CONFIG["max_length"])],
-                    "features": [0 for i in range(ANALYSIS_CONFIG["feature_num"])]
-                }
-            else:
-                txStatic = staticAnalysis.encoded_report[tx.hash]
-            
-            for feature in txStatic["features"]:
-                txLine += intToOnehot(feature, TRAIN_CONFIG["feature_size"])
-            for token in txStatic["taint"]:
-                txLine += intToOnehot(token, TRAIN_CONFIG["token_size"])
-            for counter in [tx.tmp_visited, tx.total_visited]:
-                txLine += intToOnehot(counter, TRAIN_CONFIG["token_size"])
-            txLine = np.array(txLine, dtype=np.uint8)
-
-            if txLine.shape[0] < self.sequence.shape[1]:
-                txLine = np.append(txLine, hexToBinary(
-                    "0x0", self.sequence.shape[1] - txLine.shape[0]))
-            elif txLine.shape[0] > self.sequence.shape[1]:
-                txLine = txLine[:self.sequence.shape[1]]
-
-            self.sequence = np.append(
-                self.sequence, np.expand_dims(txLine, axis=0), axis=0)
-
-        while self.sequence.shape[0] <= self.maxCallNum:
-            txLine = hexToBinary("0x0", self.sequence.shape[1])
-            self.sequence = np.append(
-                self.sequence, np.expand_dims(txLine, axis=0), axis=0)
-        self.sequence = self.sequence[1:]
-        self.sequence = np.expand_dims(self.sequence, axis=2)
+            lines.append(self.encodeTx(tx, encodedReport.get(tx.hash, self.emptyStatic)))
+
+        while len(lines) < self.maxCallNum:
+            lines.append(self.emptyLine)
+        self.sequence = np.expand_dims(np.array(lines, dtype=np.uint8), axis=2)
         return self.sequence, self.txNum
 
     def decodeState(self, state):